@@ -2,12 +2,15 @@
 Example usage of slot_game_utils package.
 """
 
+import numpy as np
+
 from slot_game_utils import (
     extract_winline_spinwin_data,
     extract_game_detail,
     check_wild_symbols,
     check_wild_presence,
     check_win,
+    evaluate_line,
 )
 
 
@@ -28,9 +31,10 @@ def example_basic_usage():
     print(f"   Spin wins: {spin_wins}\n")
     
     # Example 2: Check wild symbols
+    # Build the wild set once and reuse it for every call in the spin
     print("2. Checking wild symbols:")
     line = [1, 5, 3, 5, 2]
-    wild_ids = [5, 10]
+    wild_ids = frozenset([5, 10])
     
     wild_positions = check_wild_symbols(line, wild_ids)
     print(f"   Line: {line}")
@@ -88,27 +92,28 @@ def example_complex_scenario():
     print("\n\n=== Complex Scenario: Multi-line Slot Game ===\n")
     
     # Game configuration
-    wild_ids = [0]  # Symbol 0 is wild
+    wild_ids = frozenset([0])  # Symbol 0 is wild; one set reused for the whole spin
     pay_table = {
         3: {0: 50, 1: 30, 2: 25, 3: 20, 4: 15},
         4: {0: 100, 1: 60, 2: 50, 3: 40, 4: 30},
         5: {0: 200, 1: 120, 2: 100, 3: 80, 4: 60}
     }
     
-    # Game matrix (5x3 slot)
-    matrix = [
+    # Game matrix (5x3 slot) as one contiguous int32 array: paylines slice
+    # out vectorized instead of indexing 15 boxed Python ints
+    matrix = np.array([
         [0, 1, 2],  # Reel 1
         [1, 0, 3],  # Reel 2
         [1, 2, 0],  # Reel 3
         [3, 1, 2],  # Reel 4
         [2, 3, 1]   # Reel 5
-    ]
-    
+    ], dtype=np.int32)
+
     # Define paylines (simplified - just 3 horizontal lines)
     paylines = [
-        [matrix[0][0], matrix[1][0], matrix[2][0], matrix[3][0], matrix[4][0]],  # Top row
-        [matrix[0][1], matrix[1][1], matrix[2][1], matrix[3][1], matrix[4][1]],  # Middle row
-        [matrix[0][2], matrix[1][2], matrix[2][2], matrix[3][2], matrix[4][2]]   # Bottom row
+        matrix[:, 0],  # Top row
+        matrix[:, 1],  # Middle row
+        matrix[:, 2]   # Bottom row
     ]
     
     total_win = 0
@@ -118,13 +123,12 @@ def example_complex_scenario():
     print("Checking paylines:")
     for idx, line in enumerate(paylines):
         line_id = idx + 1
-        wilds = check_wild_symbols(line, wild_ids)
-        
-        win, code, winlines, spinWins = check_win(line, line_id, wilds, wild_ids, pay_table)
-        
+
+        # evaluate_line fuses the wild check and win scan into one pass
+        win, code, winlines, spinWins = evaluate_line(line, line_id, wild_ids, pay_table)
+
         if win > 0:
             print(f"\nPayline {line_id}: {line}")
-            print(f"   Wild positions: {wilds}")
             print(f"   Win: {win}")
             print(f"   Code: {code}")
             
@@ -1,5 +1,20 @@
+import os
+
 from setuptools import setup, find_packages
 
+# The Cython extension is a pure accelerator: build it when Cython and the
+# .pyx source are both available, fall back to the Python implementations
+# otherwise (e.g. installing from an artifact that omits the .pyx)
+ext_modules = []
+if os.path.exists("slot_game_utils/_core_c.pyx"):
+    try:
+        from Cython.Build import cythonize
+        ext_modules = cythonize(
+            ["slot_game_utils/_core_c.pyx"], language_level=3
+        )
+    except ImportError:
+        pass
+
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
@@ -13,6 +28,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/roopeshponggames/slot-game-utils",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -30,6 +46,9 @@ setup(
         "numpy>=1.19.0",
     ],
     extras_require={
+        "fast": [
+            "numba>=0.56",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
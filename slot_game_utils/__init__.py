@@ -9,20 +9,45 @@ This package provides functions for:
 
 from .core import (
     extract_winline_spinwin_data,
+    extract_winlines_batch,
     extract_game_detail,
-    check_wild_symbols,
-    check_wild_presence,
-    check_win,
+    extract_spin_winlines,
+    build_wild_lut,
+    check_wild_symbols_lut,
+    check_wins_batch,
+    compile_pay_table,
+    flatten_pay_table,
+    evaluate_line,
+    format_code,
+    make_check_win,
 )
 
+# The scalar trio comes from the optional Cython extension when it was
+# built (pip install with Cython available); otherwise the pure Python
+# implementations in core are used, with identical behaviour
+try:
+    from ._core_c import check_wild_symbols, check_wild_presence, check_win
+except ImportError:  # pragma: no cover - extension is optional
+    from .core import check_wild_symbols, check_wild_presence, check_win
+
 __version__ = "0.1.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
 __all__ = [
     "extract_winline_spinwin_data",
+    "extract_winlines_batch",
     "extract_game_detail",
+    "extract_spin_winlines",
+    "build_wild_lut",
     "check_wild_symbols",
+    "check_wild_symbols_lut",
     "check_wild_presence",
     "check_win",
+    "check_wins_batch",
+    "compile_pay_table",
+    "flatten_pay_table",
+    "evaluate_line",
+    "format_code",
+    "make_check_win",
 ]
\ No newline at end of file
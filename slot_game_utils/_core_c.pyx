@@ -0,0 +1,104 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional Cython implementations of the hot scalar trio.
+
+Compiled builds of check_wild_symbols, check_wild_presence, and check_win
+remove the interpreter overhead of the tight per-symbol loops for
+deployments where numba is unavailable. The package works identically
+without this module: slot_game_utils/__init__.py falls back to the pure
+Python versions in core when the extension was not built.
+
+Inputs outside the common list/dict shapes (ndarray lines, compiled dense
+pay tables) are delegated back to the core implementations, which carry
+the vectorized and numba paths for exactly those types.
+"""
+
+from . import core as _core
+
+
+cpdef check_wild_symbols(line, wild_ids):
+    """Typed loop version of core.check_wild_symbols for list lines."""
+    if not isinstance(line, list):
+        return _core.check_wild_symbols(line, wild_ids)
+
+    cdef Py_ssize_t i, n = len(line)
+    cdef set ws = set(wild_ids)
+    cdef list out = [False] * n
+    for i in range(n):
+        out[i] = line[i] in ws
+    return out
+
+
+cpdef int check_wild_presence(line, wild_ids):
+    """Typed early-exit version of core.check_wild_presence for list lines."""
+    if not isinstance(line, list):
+        return _core.check_wild_presence(line, wild_ids)
+    if not wild_ids:
+        return 0
+
+    cdef Py_ssize_t i, n = len(line)
+    cdef set ws = set(wild_ids)
+    for i in range(n):
+        if line[i] in ws:
+            return 1
+    return 0
+
+
+cpdef tuple check_win(line, long line_id, wilds, wild_ids, pay_table):
+    """Typed scan version of core.check_win for list lines and dict tables."""
+    if not isinstance(line, list) or not isinstance(pay_table, dict):
+        return _core.check_win(line, line_id, wilds, wild_ids, pay_table)
+
+    cdef Py_ssize_t i, line_len = len(line)
+    cdef Py_ssize_t first_non_wild = line_len
+    cdef Py_ssize_t sequence_length = 0
+    cdef long symbol_to_match = -1
+    cdef long first_symbol
+    cdef int wild_flag
+    cdef Py_ssize_t length
+
+    for i in range(line_len):
+        if not wilds[i]:
+            first_non_wild = i
+            break
+
+    # All wilds: pays on the first symbol over the full line
+    if first_non_wild == line_len:
+        symbol_to_match = line[0]
+        win = pay_table.get(line_len, _core._EMPTY).get(symbol_to_match, 0)
+        code_t = (0, line_len, 1, symbol_to_match)
+        code_01 = _core.format_code(code_t)
+        return win, code_01, (line_id, line_len, symbol_to_match, win), (win,)
+
+    symbol_to_match = line[first_non_wild]
+    sequence_length = 1
+    wild_flag = 1 if first_non_wild > 0 else 0
+    for i in range(first_non_wild + 1, line_len):
+        if wilds[i]:
+            sequence_length += 1
+            wild_flag = 1
+        elif line[i] == symbol_to_match:
+            sequence_length += 1
+        else:
+            break
+
+    length = first_non_wild + sequence_length
+    win = pay_table.get(length, _core._EMPTY).get(symbol_to_match, 0)
+
+    # A leading all-wild prefix of length >= 2 may pay more on its own
+    if first_non_wild >= 2:
+        first_symbol = line[0]
+        alt_win = pay_table.get(first_non_wild, _core._EMPTY).get(first_symbol, 0)
+        if alt_win > win:
+            code_t = (0, first_non_wild, 1, first_symbol)
+            code_01 = _core.format_code(code_t)
+            return (
+                alt_win,
+                code_01,
+                (line_id, first_non_wild, first_symbol, alt_win),
+                (alt_win,),
+            )
+
+    code_t = (0, length, wild_flag, symbol_to_match)
+    code_01 = _core.format_code(code_t)
+    return win, code_01, (line_id, length, symbol_to_match, win), (win,)
@@ -2,31 +2,122 @@
 Core functions for slot game simulation utilities.
 """
 
+import array
+import logging
+import re
+import sys
+import threading
+from functools import lru_cache, singledispatch
 from itertools import chain
-from typing import List, Dict, Any, Union, Tuple
+from typing import Callable, List, Dict, Any, FrozenSet, Optional, Set, Union, Tuple
 import numpy as np
 
+logger = logging.getLogger("slot_game_utils")
+
+try:
+    from numba import njit as _njit
+    _HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    _HAVE_NUMBA = False
+
+# Wild IDs may be passed as a list (legacy) or any set type; callers should
+# build one frozenset per game and reuse it across the whole spin
+WildIds = Union[List[int], Set[int], FrozenSet[int]]
+
+# Paylines may be plain lists (legacy), typed array.array buffers, or int
+# ndarrays; the typed forms avoid boxing every symbol as a PyLongObject and
+# unlock the compiled scan paths
+Line = Union[List[int], array.array, np.ndarray]
+
+# Preferred game-matrix layout: a contiguous int32 ndarray of shape
+# (num_reels, num_rows). One allocation for the whole grid, paylines come
+# out as vectorized slices, and the ticket flatten is a single memcpy
+Matrix = np.ndarray
+
+# Shared empty row for pay-table misses, so the hot path never allocates
+_EMPTY: Dict[int, float] = {}
+
+
+# Internal win-code representation: (kind, length, wild_flag, symbol_id).
+# check_win works with these tuples and only formats the display string at
+# the serialization boundary, avoiding a format/split/int round-trip per line
+CodeTuple = Tuple[int, int, int, int]
+
+_CODE_KINDS = ("B", "TF")
+
+# Precompiled pattern for "<prefix>-#combination-<wild flag>-symbol_id[-...]"
+# codes; matching runs entirely in the C regex engine and replaces the
+# split() list allocation plus per-part int() validation
+_CODE_RE = re.compile(r'^[^-]*-(\d+)-[^-]*-(\d+)(?:-|$)')
+
+
+# Formatted code strings keyed by their tuple; the cardinality is tiny
+# (kinds x lengths x flags x pay-table symbols), so the cache is unbounded
+_CODE_CACHE: Dict[CodeTuple, str] = {}
+
+
+def format_code(code_tuple: CodeTuple) -> str:
+    """
+    Format an internal win-code tuple into its display string.
+
+    Only a few hundred distinct codes exist per game, so each string is
+    formatted once, interned, and served from a dict afterwards.
+
+    Args:
+        code_tuple (CodeTuple): (kind, length, wild_flag, symbol_id) where
+                                kind indexes into ("B", "TF")
+
+    Returns:
+        str: Code string such as "B-3-0-2"
+
+    Example:
+        >>> format_code((0, 3, 1, 2))
+        'B-3-1-2'
+    """
+    code = _CODE_CACHE.get(code_tuple)
+    if code is None:
+        kind, length, wild_flag, symbol_id = code_tuple
+        code = _CODE_CACHE[code_tuple] = sys.intern(
+            f"{_CODE_KINDS[kind]}-{length}-{wild_flag}-{symbol_id}"
+        )
+    return code
+
+
+def _extract_winline_spinwin_data_fast(
+    winline_id: int, code_tuple: CodeTuple, win_amount: float
+) -> Tuple[Tuple[Union[int, float], ...], Tuple[float, ...]]:
+    """
+    Build winline/spin-win data directly from an internal code tuple.
+
+    Fast path used by check_win: the fields are already integers, so there
+    is nothing to parse back out of a string.
+    """
+    winlines = (winline_id, code_tuple[1], code_tuple[3], win_amount)
+    return winlines, (win_amount,)
+
 
 def extract_winline_spinwin_data(
     winline_id: int, code: str, win_amount: float
-) -> tuple[List[Union[int, float]], List[float]]:
+) -> Tuple[Tuple[Union[int, float], ...], Tuple[float, ...]]:
     """
     Extract winline and spin win data from a formatted code string.
-    
+
     This function parses a specially formatted code string to extract game-related
     information including combination count, wild win status, and symbol information.
-    
+    The returned tuples are immutable, so the per-call allocations stay minimal
+    and results can be shared freely downstream.
+
     Args:
         winline_id (int): The unique identifier for the winline
         code (str): Formatted string following the pattern:
                    <B or TFn>-#combination-<1 if win is by wild, else 0>-symbol_id-multiplier
                    Example: "B-3-0-02-1"
         win_amount (float): The amount won on this winline
-    
+
     Returns:
-        tuple: A tuple containing two lists:
-            - winlines (list): Contains [winline_id, combination_count, symbol_id, win_amount]
-            - spinWins (list): Contains [win_amount]
+        tuple: A tuple containing two tuples:
+            - winlines (tuple): Contains (winline_id, combination_count, symbol_id, win_amount)
+            - spinWins (tuple): Contains (win_amount,)
 
     Example:
         >>> line = [3, 3, 3, 5, 0]
@@ -38,54 +129,123 @@ def extract_winline_spinwin_data(
             5: {0: 200, 1: 120, 2: 100, 3: 80, 4: 60}
             }
         >>> winlines, spinWins = extract_winline_spinwin_data(line_id, code, 20)
-            ([2, 3, 3, 20], [20])
+            ((2, 3, 3, 20), (20,))
 
     """
-    # Initialize return lists
-    winlines = []
-    spinWins = []
-    
-    # Parse the code string
-    code_parts = code.split('-')
-    
-    try:
-        # Validate that we have the expected number of parts
-        if len(code_parts) < 4:
-            raise ValueError("Insufficient code segments")
-        
-        # Extract relevant data from parsed code
-        combination_count = int(code_parts[1])  # Number of winning combinations
-        symbol_id = int(code_parts[3])          # ID of the winning symbol
-        
-        # Build the winlines data structure
-        winlines = [
-            winline_id,         # Unique winline identifier
-            combination_count,  # Number of combinations in this win
-            symbol_id,          # Symbol that created the win
-            win_amount         # Amount won on this line
-        ]
-        
-    except (IndexError, ValueError) as e:
-        # Log error with descriptive message
-        error_msg = (
-            "-E- Error parsing code. Expected format: "
-            "<B or TFn>-#combination-<1 if win is by wild, else 0>-symbol_id-multiplier  "
-            "Example: B-3-0-02-1"
+    # Only a handful of distinct codes exist per pay table, so the parse is
+    # memoized per code string and recurring codes skip the regex entirely
+    parsed = _parse_code(code)
+
+    if parsed is not None:
+        combination_count, symbol_id = parsed
+        winlines = (
+            winline_id,             # Unique winline identifier
+            combination_count,      # Number of combinations in this win
+            symbol_id,              # Symbol that created the win
+            win_amount              # Amount won on this line
         )
-        print(error_msg)
-        # Return empty winlines list on error
-        winlines = []
-    
+    else:
+        # Log error with descriptive message; the f-string-free logging call
+        # costs nothing unless debug logging is actually enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Error parsing code %r. Expected format: "
+                "<B or TFn>-#combination-<1 if win is by wild, else 0>-symbol_id-multiplier  "
+                "Example: B-3-0-02-1",
+                code,
+            )
+        # Return the shared empty winlines tuple on error
+        winlines = ()
+
     # Spin wins always contains the win amount (even on error)
-    spinWins = [win_amount]
-    
+    spinWins = (win_amount,)
+
     return winlines, spinWins
 
 
+@lru_cache(maxsize=4096)
+def _parse_code(code: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse a win code string into (combination_count, symbol_id), memoized.
+
+    Returns None for codes that do not match the expected format.
+    """
+    match = _CODE_RE.match(code)
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def extract_winlines_batch(
+    winline_ids: Union[List[int], np.ndarray],
+    codes: Union[List[CodeTuple], List[str]],
+    win_amounts: Union[List[float], np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Extract winline and spin win data for a whole batch of winning lines.
+
+    Batch counterpart of extract_winline_spinwin_data: when the codes are
+    internal tuples (as produced inside check_win) there is nothing to parse
+    and the winline matrix is assembled with a single column_stack. Legacy
+    string codes are parsed row by row; rows whose code fails to parse are
+    dropped from the winline matrix, matching the scalar error behaviour,
+    while their win amounts are still recorded in the spin wins.
+
+    Args:
+        winline_ids (Union[List[int], np.ndarray]): Winline identifier per row
+        codes (Union[List[CodeTuple], List[str]]): Win code per row, either
+                                                    internal tuples or
+                                                    "B-3-0-2"-style strings
+        win_amounts (Union[List[float], np.ndarray]): Win amount per row
+
+    Returns:
+        Tuple containing:
+            - winlines (np.ndarray): float64 array of shape (N, 4) with rows
+              [winline_id, combination_count, symbol_id, win_amount]
+            - spin_wins (np.ndarray): float64 array of all win amounts
+
+    Example:
+        >>> winlines, spin_wins = extract_winlines_batch(
+        ...     [1, 2], [(0, 3, 0, 2), (0, 4, 1, 1)], [30.0, 60.0]
+        ... )
+        >>> winlines.tolist()
+        [[1.0, 3.0, 2.0, 30.0], [2.0, 4.0, 1.0, 60.0]]
+    """
+    ids = np.asarray(winline_ids, dtype=np.int64)
+    amounts = np.asarray(win_amounts, dtype=np.float64)
+
+    if len(codes) > 0 and isinstance(codes[0], str):
+        # Legacy string path: memoized parse per code, keeping only valid rows
+        parsed = []
+        valid = np.zeros(len(codes), dtype=np.bool_)
+        for i, code in enumerate(codes):
+            result = _parse_code(code)
+            if result is not None:
+                parsed.append(result)
+                valid[i] = True
+        if parsed:
+            lengths, symbols = (np.asarray(col, dtype=np.int64) for col in zip(*parsed))
+        else:
+            lengths = symbols = np.zeros(0, dtype=np.int64)
+        ids = ids[valid]
+        row_amounts = amounts[valid]
+    else:
+        # Internal tuple path: the fields are already integers — zero parsing
+        count = len(codes)
+        lengths = np.fromiter((c[1] for c in codes), dtype=np.int64, count=count)
+        symbols = np.fromiter((c[3] for c in codes), dtype=np.int64, count=count)
+        row_amounts = amounts
+
+    winlines = np.column_stack([ids, lengths, symbols, row_amounts]) \
+        if len(ids) else np.zeros((0, 4), dtype=np.float64)
+
+    return winlines, amounts
+
+
 def extract_game_detail(
     total_win: float,
     trigger_type: str,
-    matrix: List[List[Any]],
+    matrix: Union[List[List[Any]], Matrix],
     winlines: List[List[Union[int, float]]],
     spin_wins: List[float]
 ) -> Dict[str, Any]:
@@ -99,8 +259,10 @@ def extract_game_detail(
         total_win (float): The total amount won in this game round
         trigger_type (str): The type of trigger that initiated this game
                            (e.g., 'normal', 'bonus', 'free_spin')
-        matrix (List[List[Any]]): 2D matrix representing the game reels/grid
-                                  Will be flattened to 1D in the output
+        matrix (Union[List[List[Any]], np.ndarray]): 2D matrix representing the
+                                  game reels/grid; an int ndarray flattens as a
+                                  single contiguous copy. Flattened to 1D in
+                                  the output
         winlines (List[List[Union[int, float]]]): List of winning line details
                                                   (Note: Currently unused in output)
         spin_wins (List[float]): List of individual spin win amounts
@@ -137,9 +299,27 @@ def extract_game_detail(
             'spinWins': [20]}
     """
     # Flatten the 2D matrix into a 1D list for easier serialization
-    # This converts [[1,2,3], [4,5,6]] into [1,2,3,4,5,6]
-    flattened_matrix = list(chain.from_iterable(matrix))
-    
+    # This converts [[1,2,3], [4,5,6]] into [1,2,3,4,5,6]. Rectangular
+    # numeric matrices flatten as one contiguous C-level copy; ragged or
+    # non-numeric input falls back to the generic iterator path
+    if isinstance(matrix, np.ndarray):
+        flattened_matrix = matrix.ravel().tolist()
+    elif not matrix:
+        flattened_matrix = []
+    elif isinstance(matrix[0], np.ndarray):
+        # Rows are already typed arrays (e.g. matrix column slices): one
+        # concatenate copies them back to back, even when lengths differ
+        flattened_matrix = np.concatenate(matrix).tolist()
+    else:
+        try:
+            matrix_arr = np.asarray(matrix)
+        except (ValueError, TypeError):
+            matrix_arr = None
+        if matrix_arr is not None and matrix_arr.ndim == 2 and matrix_arr.dtype != object:
+            flattened_matrix = matrix_arr.ravel().tolist()
+        else:
+            flattened_matrix = list(chain.from_iterable(matrix))
+
     # Construct the game ticket with standardized field names
     game_ticket = {
         "win": total_win,
@@ -152,64 +332,949 @@ def extract_game_detail(
     return game_ticket
 
 
-def check_wild_symbols(line: List[int], wild_ids: List[int]) -> List[bool]:
+def build_wild_lut(wild_ids: WildIds, max_symbol_id: int) -> np.ndarray:
+    """
+    Build a boolean lookup table of wild symbols indexed by symbol ID.
+
+    The table turns every wild membership test into a single array index,
+    so a whole line can be classified with one vectorized gather instead of
+    per-symbol `in` scans. Build it once per game and reuse it across spins.
+
+    Args:
+        wild_ids (WildIds): Symbol IDs that are considered wild; a reused
+                            frozenset gives O(1) membership on the hot path
+        max_symbol_id (int): Highest symbol ID used by the game
+
+    Returns:
+        np.ndarray: Boolean array of shape (max_symbol_id + 1,) where
+                    lut[symbol_id] is True for wild symbols
+
+    Example:
+        >>> build_wild_lut([0, 2], 3)
+        array([ True, False,  True, False])
+    """
+    lut = np.zeros(max_symbol_id + 1, dtype=np.bool_)
+    if wild_ids:
+        lut[np.asarray(list(wild_ids), dtype=np.intp)] = True
+    return lut
+
+
+def check_wild_symbols_lut(line_arr: np.ndarray, lut: np.ndarray) -> np.ndarray:
+    """
+    Check which symbols in a line are wild using a precomputed lookup table.
+
+    Fast path for callers that keep the line as an ndarray and have already
+    built the LUT via build_wild_lut; the result stays an ndarray so
+    downstream vectorized code avoids any list round-trip.
+
+    Args:
+        line_arr (np.ndarray): Array of symbol IDs representing a payline
+        lut (np.ndarray): Boolean lookup table from build_wild_lut
+
+    Returns:
+        np.ndarray: Boolean array where True indicates a wild symbol
+    """
+    return lut[np.asarray(line_arr, dtype=np.intp)]
+
+
+# Cache of wild LUTs keyed by the wild ID tuple, so the table is built once
+# per game configuration rather than once per payline
+_WILD_LUT_CACHE: Dict[Tuple[int, ...], np.ndarray] = {}
+
+
+# Thread-local scratch buffers for intermediate masks on the hot ndarray
+# paths; results handed back to callers are never drawn from here
+_TLS = threading.local()
+
+
+def _get_scratch(shape: Tuple[int, ...], dtype: Any) -> np.ndarray:
+    """
+    Return a reusable thread-local buffer of the given shape and dtype.
+
+    For the fixed 5-reel shapes that dominate production traffic, reusing
+    one buffer per (shape, dtype) removes the allocator round-trip that
+    otherwise dominates such tiny array operations.
+    """
+    key = (shape, np.dtype(dtype).str)
+    buffers = getattr(_TLS, "buffers", None)
+    if buffers is None:
+        buffers = _TLS.buffers = {}
+    buf = buffers.get(key)
+    if buf is None:
+        buf = buffers[key] = np.empty(shape, dtype)
+    return buf
+
+
+@lru_cache(maxsize=64)
+def _wild_ids_array(ids_tuple: Tuple[int, ...]) -> np.ndarray:
+    """Build (once per distinct tuple) the ndarray of wild IDs."""
+    return np.asarray(ids_tuple)
+
+
+@lru_cache(maxsize=64)
+def _wilds_fs(ids_tuple: Tuple[int, ...]) -> FrozenSet[int]:
+    """Build (once per distinct tuple) the frozenset of wild IDs."""
+    return frozenset(ids_tuple)
+
+
+def _wild_set_for(wild_ids: WildIds) -> Union[Set[int], FrozenSet[int]]:
+    """
+    Return wild_ids as a set, without rebuilding it on every call.
+
+    Callers passing a set or frozenset get it back unchanged; list input
+    (the legacy convention, typically 1-3 IDs repeated across a whole
+    game) resolves through a small memo keyed on the tuple of IDs.
+    """
+    if isinstance(wild_ids, (set, frozenset)):
+        return wild_ids
+    return _wilds_fs(tuple(wild_ids))
+
+
+def _wild_lut_for(wild_ids: WildIds) -> np.ndarray:
+    """Return a cached wild LUT sized to the given wild IDs."""
+    key = tuple(sorted(wild_ids))
+    lut = _WILD_LUT_CACHE.get(key)
+    if lut is None:
+        max_symbol_id = max(wild_ids) if wild_ids else 0
+        lut = _WILD_LUT_CACHE[key] = build_wild_lut(list(key), max_symbol_id)
+    return lut
+
+
+def check_wild_symbols(
+    line: Union[List[int], np.ndarray], wild_ids: WildIds
+) -> Union[List[bool], np.ndarray]:
     """
     Check which symbols in a line are wild symbols.
-    
+
     Creates a boolean mask indicating the position of wild symbols in the given line.
     This is useful for identifying wild symbol patterns in winning combinations.
-    
+    ndarray lines are classified fully vectorized and keep the mask as an
+    ndarray; list input returns a list for backward compatibility.
+
     Args:
-        line (List[int]): List of symbol IDs representing a payline
-        wild_ids (List[int]): List of symbol IDs that are considered wild symbols
-    
+        line (Union[List[int], np.ndarray]): Symbol IDs representing a payline
+        wild_ids (WildIds): Symbol IDs that are considered wild symbols; pass
+                            one frozenset per game and reuse it across the spin
+
     Returns:
-        List[bool]: Boolean list where True indicates a wild symbol at that position
-    
+        Union[List[bool], np.ndarray]: Boolean mask where True indicates a wild
+                                        symbol at that position; same container
+                                        kind as the input line
+
     Example:
         >>> line = [1, 5, 3, 5, 2]
         >>> wild_ids = [5, 10]
         >>> check_wild_symbols(line, wild_ids)
         [False, True, False, True, False]
     """
-    # Create boolean mask for wild positions
-    wilds = [symbol in wild_ids for symbol in line]
-    return wilds
+    if isinstance(line, np.ndarray):
+        wilds_arr = _wild_ids_array(tuple(sorted(wild_ids)))
+        if wilds_arr.size == 0:
+            return np.zeros(line.shape, dtype=np.bool_)
+        if wilds_arr.size <= 4:
+            # Per-wild equality beats np.isin's sort/hash setup for the
+            # common case of one to three wild symbols; the intermediate
+            # compares go through a reused scratch buffer, so only the
+            # returned mask is a fresh allocation
+            mask = np.equal(line, wilds_arr[0])
+            if wilds_arr.size > 1:
+                tmp = _get_scratch(line.shape, np.bool_)
+                for wild_id in wilds_arr[1:]:
+                    np.equal(line, wild_id, out=tmp)
+                    np.logical_or(mask, tmp, out=mask)
+            return mask
+        return np.isin(line, wilds_arr)
 
+    # Short lists (the typical 5-reel payline) classify fastest with a
+    # presized list comprehension over a set: the comprehension allocates
+    # the result once in C and skips the list->array->list round-trip
+    if len(line) < 64:
+        wild_set = _wild_set_for(wild_ids)
+        return [s in wild_set for s in line]
 
-def check_wild_presence(line: Union[List[int], np.ndarray], wild_ids: List[int]) -> int:
+    # Long lines classify through the cached LUT in one gather; symbols
+    # outside the table (higher than any wild ID) are never wild
+    lut = _wild_lut_for(wild_ids)
+    line_arr = np.asarray(line, dtype=np.intp)
+    wilds = np.zeros(line_arr.shape, dtype=np.bool_)
+    in_range = (line_arr >= 0) & (line_arr < lut.shape[0])
+    wilds[in_range] = lut[line_arr[in_range]]
+    return wilds.tolist()
+
+
+@singledispatch
+def check_wild_presence(line: Union[List[int], np.ndarray], wild_ids: WildIds) -> int:
     """
     Check if any wild symbols are present in the line.
-    
+
     Efficiently checks for the presence of wild symbols using NumPy operations.
-    
+    The implementation is selected per line type through singledispatch, so
+    the hot path pays one cached type lookup instead of isinstance checks:
+    ndarray lines go straight to the vectorized membership test below, and
+    every other sequence type lands here.
+
     Args:
         line (Union[List[int], np.ndarray]): Sequence of symbol IDs to check
-        wild_ids (List[int]): List of symbol IDs that are considered wild
-    
+        wild_ids (WildIds): Symbol IDs that are considered wild; a reused
+                            frozenset gives O(1) membership on the hot path
+
     Returns:
         int: 1 if at least one wild symbol is present, 0 otherwise
-    
+
     Example:
         >>> line = [1, 2, 3, 4]
         >>> wild_ids = [3, 5]
         >>> check_wild_presence(line, wild_ids)
         1
     """
-    # Convert to numpy array if needed and check for wild presence
-    line_array = np.array(line) if not isinstance(line, np.ndarray) else line
-    has_wild = np.any(np.isin(line_array, wild_ids))
-    
+    # Degenerate inputs cannot contain a wild, so skip all set/array work
+    if not wild_ids or len(line) == 0:
+        return 0
+
+    # Fast path: for short Python sequences a C-level isdisjoint scan (which
+    # stops on the first hit) beats the NumPy constructor + isin dispatch by
+    # a wide margin, so only long sequences take the vectorized path
+    if len(line) < 64:
+        wild_set = _wild_set_for(wild_ids)
+        return int(not wild_set.isdisjoint(line))
+
+    line_array = np.asarray(line)
+    has_wild = np.isin(line_array, np.asarray(list(wild_ids), dtype=line_array.dtype)).any()
+
     return int(has_wild)
 
 
-def check_win(
+@check_wild_presence.register(np.ndarray)
+def _check_wild_presence_ndarray(line: np.ndarray, wild_ids: WildIds) -> int:
+    """ndarray registration: vectorized membership with no conversion."""
+    if not wild_ids or line.size == 0:
+        return 0
+    return int(np.isin(line, np.asarray(list(wild_ids), dtype=line.dtype)).any())
+
+
+def _dense_pay_table(pay_table: Dict[int, Dict[int, float]]) -> np.ndarray:
+    """
+    Flatten a nested pay table dict into a dense 2D NumPy array.
+
+    The returned array is indexed as ``PT[sequence_length, symbol_id]`` and
+    holds 0.0 for every combination that has no entry in the pay table, so
+    payout lookups become a single array index with no dict hashing.
+
+    Args:
+        pay_table (Dict[int, Dict[int, float]]): Nested dict mapping
+                                                  [sequence_length][symbol_id] -> payout
+
+    Returns:
+        np.ndarray: Dense float64 array of shape (max_length + 1, max_symbol + 1)
+    """
+    if not pay_table:
+        return np.zeros((1, 1), dtype=np.float64)
+
+    max_length = max(pay_table)
+    symbol_ids = [s for row in pay_table.values() for s in row]
+    max_symbol = max(symbol_ids) if symbol_ids else 0
+
+    dense = np.zeros((max_length + 1, max_symbol + 1), dtype=np.float64)
+    for length, row in pay_table.items():
+        for symbol_id, payout in row.items():
+            dense[length, symbol_id] = payout
+
+    return dense
+
+
+# Cache of compiled pay tables keyed by the source dict's id; the source is
+# kept alongside the array so a recycled id cannot alias a different table.
+# A None array records a table judged too sparse to compile automatically
+_PAY_TABLE_CACHE: Dict[
+    int, Tuple[Dict[int, Dict[int, float]], Optional[np.ndarray]]
+] = {}
+
+# Automatic compilation stops above this many dense cells: a pay table with
+# huge symbol IDs would waste memory as an array for no lookup benefit
+_DENSE_PT_MAX_CELLS = 1 << 16
+
+
+def compile_pay_table(
+    pay_table: Union[Dict[int, Dict[int, float]], np.ndarray]
+) -> np.ndarray:
+    """
+    Compile a nested pay table dict into a dense 2D NumPy array.
+
+    The compiled table is indexed as ``PT[sequence_length, symbol_id]`` and
+    holds 0.0 for combinations with no entry, turning the two chained dict
+    lookups per payout into a single bounds-checked array index. Results are
+    cached per source dict, so compiling happens once per game, not per spin.
+
+    Args:
+        pay_table (Union[Dict, np.ndarray]): Nested dict mapping
+                                              [sequence_length][symbol_id] -> payout,
+                                              or an already-compiled array
+                                              (returned unchanged)
+
+    Returns:
+        np.ndarray: Dense float64 array of shape (max_length + 1, max_symbol + 1)
+
+    Example:
+        >>> compile_pay_table({2: {0: 10.0}})
+        array([[ 0.,  0.],
+               [ 0.,  0.],
+               [10.,  0.]])
+    """
+    if isinstance(pay_table, np.ndarray):
+        return pay_table
+
+    cached = _PAY_TABLE_CACHE.get(id(pay_table))
+    if cached is not None and cached[0] is pay_table and cached[1] is not None:
+        return cached[1]
+
+    dense = _dense_pay_table(pay_table)
+    _PAY_TABLE_CACHE[id(pay_table)] = (pay_table, dense)
+    return dense
+
+
+def _auto_compile(
+    pay_table: Union[Dict[int, Dict[int, float]], np.ndarray]
+) -> Union[Dict[int, Dict[int, float]], np.ndarray]:
+    """
+    Compile a dict pay table to its dense form when the result stays small.
+
+    Returns the dict unchanged (and remembers the decision) when the dense
+    array would exceed _DENSE_PT_MAX_CELLS, so callers transparently keep
+    the hash-based lookup for pathologically sparse tables.
+    """
+    if isinstance(pay_table, np.ndarray) or not pay_table:
+        return pay_table
+
+    cached = _PAY_TABLE_CACHE.get(id(pay_table))
+    if cached is not None and cached[0] is pay_table:
+        return cached[1] if cached[1] is not None else pay_table
+
+    max_length = max(pay_table)
+    symbol_ids = [s for row in pay_table.values() for s in row]
+    max_symbol = max(symbol_ids) if symbol_ids else 0
+    if (max_length + 1) * (max_symbol + 1) > _DENSE_PT_MAX_CELLS:
+        _PAY_TABLE_CACHE[id(pay_table)] = (pay_table, None)
+        return pay_table
+
+    return compile_pay_table(pay_table)
+
+
+# Packed flat-key layout: (sequence_length << 32) | symbol_id. A 32-bit
+# shift leaves room for the sparse symbol IDs that keep a table off the
+# dense-array path in the first place
+_FLAT_PT_SHIFT = 32
+
+# Flattened pay tables keyed by the source dict's id, with the source kept
+# alongside so a recycled id cannot alias a different table
+_FLAT_PT_CACHE: Dict[int, Tuple[Dict[int, Dict[int, float]], Dict[int, float]]] = {}
+
+
+def flatten_pay_table(pay_table: Dict[int, Dict[int, float]]) -> Dict[int, float]:
+    """
+    Collapse a nested pay table dict into a single flat dict.
+
+    Keys pack (sequence_length, symbol_id) into one int, so a payout
+    lookup costs one hash probe instead of two chained ones. This is the
+    fallback representation for tables too sparse for compile_pay_table's
+    dense array.
+
+    Args:
+        pay_table (Dict[int, Dict[int, float]]): Nested dict mapping
+                                                  [sequence_length][symbol_id] -> payout
+
+    Returns:
+        Dict[int, float]: Flat dict keyed by
+        ``(sequence_length << 32) | symbol_id``
+
+    Example:
+        >>> flatten_pay_table({3: {2: 30.0}})
+        {12884901890: 30.0}
+    """
+    flat = {}
+    for length, row in pay_table.items():
+        base = length << _FLAT_PT_SHIFT
+        for symbol_id, payout in row.items():
+            flat[base | symbol_id] = payout
+    return flat
+
+
+def _flat_pay_table(pay_table: Dict[int, Dict[int, float]]) -> Dict[int, float]:
+    """Return the cached flat form of a nested pay table dict."""
+    cached = _FLAT_PT_CACHE.get(id(pay_table))
+    if cached is not None and cached[0] is pay_table:
+        return cached[1]
+    flat = flatten_pay_table(pay_table)
+    _FLAT_PT_CACHE[id(pay_table)] = (pay_table, flat)
+    return flat
+
+
+def _payout(
+    pay_table: Union[Dict[int, Dict[int, float]], np.ndarray],
+    sequence_length: int,
+    symbol_id: int
+) -> float:
+    """Look up a payout from either a dict or a compiled dense pay table."""
+    if isinstance(pay_table, np.ndarray):
+        if 0 <= sequence_length < pay_table.shape[0] and 0 <= symbol_id < pay_table.shape[1]:
+            return float(pay_table[sequence_length, symbol_id])
+        return 0.0
+    if symbol_id >= 0:
+        payout = _flat_pay_table(pay_table).get(
+            (sequence_length << _FLAT_PT_SHIFT) | symbol_id, 0
+        )
+    else:
+        payout = pay_table.get(sequence_length, _EMPTY).get(symbol_id, 0)
+    if payout == 0 and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("payTable miss for length %s, symbol %s", sequence_length, symbol_id)
+    return payout
+
+
+def check_wins_batch(
+    lines: np.ndarray,
+    wild_ids: WildIds,
+    pay_table: Union[Dict[int, Dict[int, float]], np.ndarray],
+    return_arrays: bool = False
+) -> Union[
+    Tuple[np.ndarray, List[Optional[str]]],
+    Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+]:
+    """
+    Evaluate every payline of a spin in one vectorized pass.
+
+    This is the batch counterpart of check_win: instead of scanning one line
+    at a time in Python, all L paylines are advanced in lock-step with
+    column-wise NumPy operations, so the per-spin interpreter overhead is
+    O(reels) vector ops instead of O(lines * reels) Python ticks.
+
+    Args:
+        lines (np.ndarray): (L, R) array of symbol IDs, one payline per row
+        wild_ids (WildIds): Symbol IDs that are considered wild; a reused
+                            frozenset gives O(1) membership on the hot path
+        pay_table (Dict[int, Dict[int, float]]): Nested dict mapping
+                                                  [sequence_length][symbol_id] -> payout
+        return_arrays (bool): When True, skip code-string formatting and
+                              return the raw per-line result columns
+
+    Returns:
+        With return_arrays=False (default), a tuple containing:
+            - wins (np.ndarray): float64 array of shape (L,) with the win per line
+            - codes (List[Optional[str]]): Win code per line in the same
+              "B-{length}-{wild_flag}-{symbol_id}" format as check_win;
+              None for lines that did not win
+        With return_arrays=True, four parallel arrays of shape (L,):
+            (wins, run_lengths, wild_flags, symbols), ready for further
+            vectorized processing without any per-line Python objects
+
+    Example:
+        >>> lines = np.array([[1, 1, 1, 2, 3], [0, 2, 2, 2, 1]])
+        >>> wild_ids = [0]
+        >>> pay_table = {3: {1: 30, 2: 25}, 4: {1: 60, 2: 50}}
+        >>> wins, codes = check_wins_batch(lines, wild_ids, pay_table)
+        >>> wins.tolist(), codes
+        ([30.0, 50.0], ['B-3-0-1', 'B-4-1-2'])
+    """
+    lines = np.ascontiguousarray(lines, dtype=np.int32)
+    num_lines, num_reels = lines.shape
+
+    pt = compile_pay_table(pay_table)
+    max_length = pt.shape[0] - 1
+    max_symbol = pt.shape[1] - 1
+
+    row_idx = np.arange(num_lines)
+    col_idx = np.arange(num_reels)
+
+    # Wild mask for every position across all lines at once
+    is_wild = np.isin(lines, _wild_ids_array(tuple(sorted(wild_ids))))
+    all_wild = is_wild.all(axis=1)
+
+    # First non-wild column per line (0 for all-wild lines, matching the
+    # scalar path which pays the all-wild line on its first symbol)
+    first_non_wild = np.where(all_wild, 0, (~is_wild).argmax(axis=1))
+    symbol_to_match = lines[row_idx, first_non_wild]
+
+    # Run length of the leading match (wilds substitute for the symbol)
+    match = is_wild | (lines == symbol_to_match[:, None])
+    run_length = np.where(match.all(axis=1), num_reels, (~match).argmax(axis=1))
+
+    # Wild presence within the winning run
+    wild_in_run = (is_wild & (col_idx < run_length[:, None])).any(axis=1)
+
+    # Main payout via a single fancy-index into the dense pay table
+    in_bounds = (run_length <= max_length) & (symbol_to_match <= max_symbol) & (symbol_to_match >= 0)
+    wins = np.where(
+        in_bounds,
+        pt[np.minimum(run_length, max_length), np.clip(symbol_to_match, 0, max_symbol)],
+        0.0
+    )
+
+    # Alternative pattern: a leading all-wild prefix of length >= 2 may pay
+    # more as a wild combination than the substituted run
+    alt_length = first_non_wild
+    alt_symbol = lines[:, 0]
+    alt_valid = (alt_length >= 2) & (alt_length <= max_length) & (alt_symbol <= max_symbol) & (alt_symbol >= 0)
+    alt_wins = np.where(
+        alt_valid,
+        pt[np.minimum(alt_length, max_length), np.clip(alt_symbol, 0, max_symbol)],
+        0.0
+    )
+
+    use_alt = alt_wins > wins
+    wins = np.where(use_alt, alt_wins, wins)
+    run_length = np.where(use_alt, alt_length, run_length)
+    symbol_to_match = np.where(use_alt, alt_symbol, symbol_to_match)
+    wild_in_run = np.where(use_alt, True, wild_in_run)
+
+    # SoA result: callers doing further vectorized work take the raw
+    # columns and never touch per-line Python objects
+    if return_arrays:
+        return wins, run_length, wild_in_run.astype(np.int64), symbol_to_match
+
+    # Only format code strings for winning lines
+    codes: List[Optional[str]] = [None] * num_lines
+    for i in np.flatnonzero(wins > 0):
+        codes[i] = f"B-{run_length[i]}-{int(wild_in_run[i])}-{symbol_to_match[i]}"
+
+    return wins, codes
+
+
+def extract_spin_winlines(
+    lines: np.ndarray,
+    wild_ids: WildIds,
+    pay_table: Union[Dict[int, Dict[int, float]], np.ndarray],
+    line_ids: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluate a whole spin and accumulate its winlines into typed arrays.
+
+    Combines check_wins_batch's SoA result with the winline-matrix
+    assembly: winning rows are compacted with one boolean mask and stacked
+    into a contiguous (N, 4) array, so no per-line Python lists of boxed
+    ints are ever built — the output is ready for ticket serialization.
+
+    Args:
+        lines (np.ndarray): (L, R) array of symbol IDs, one payline per row
+        wild_ids (WildIds): Symbol IDs that are considered wild
+        pay_table (Union[Dict, np.ndarray]): Nested dict mapping
+                                              [sequence_length][symbol_id] -> payout,
+                                              or a dense array from compile_pay_table
+        line_ids (Optional[np.ndarray]): Identifier per payline; defaults to
+                                          1-based row numbers
+
+    Returns:
+        Tuple containing:
+            - winlines (np.ndarray): float64 array of shape (N, 4) with one
+              row [line_id, combination_count, symbol_id, win_amount] per
+              winning line
+            - spin_wins (np.ndarray): float64 win amounts of the winning
+              lines, aligned with the winline rows
+
+    Example:
+        >>> lines = np.array([[2, 2, 2, 1, 3], [1, 2, 3, 4, 6]])
+        >>> winlines, spin_wins = extract_spin_winlines(
+        ...     lines, [5], {3: {2: 30}}
+        ... )
+        >>> winlines.tolist(), spin_wins.tolist()
+        ([[1.0, 3.0, 2.0, 30.0]], [30.0])
+    """
+    wins, run_lengths, _, symbols = check_wins_batch(
+        lines, wild_ids, pay_table, return_arrays=True
+    )
+
+    if line_ids is None:
+        line_ids = np.arange(1, len(wins) + 1)
+    else:
+        line_ids = np.asarray(line_ids)
+
+    mask = wins > 0
+    spin_wins = wins[mask]
+    winlines = np.stack(
+        [line_ids[mask], run_lengths[mask], symbols[mask], spin_wins], axis=1
+    ) if spin_wins.size else np.zeros((0, 4), dtype=np.float64)
+
+    return winlines, spin_wins
+
+
+def evaluate_line(
     line: List[int],
     line_id: int,
+    wild_ids: WildIds,
+    pay_table: Union[Dict[int, Dict[int, float]], np.ndarray]
+) -> Tuple[float, str, Tuple[Union[int, float], ...], Tuple[float, ...]]:
+    """
+    Evaluate a payline for wins in a single pass.
+
+    Fuses check_wild_symbols, check_win's run scan, and the wild-presence
+    check into one loop over the line: each symbol is classified, matched,
+    and counted exactly once, instead of the three separate passes (and
+    allocations) the chained check_wild_symbols + check_win calls make.
+    Returns the same tuple as check_win.
+
+    Args:
+        line (List[int]): List of symbol IDs on the payline
+        line_id (int): Unique identifier for this payline
+        wild_ids (WildIds): Symbol IDs that are considered wild; a reused
+                            frozenset gives O(1) membership on the hot path
+        pay_table (Union[Dict, np.ndarray]): Nested dict mapping
+                                              [sequence_length][symbol_id] -> payout,
+                                              or a dense array from compile_pay_table
+
+    Returns:
+        Tuple containing:
+            - win (float): The calculated win amount
+            - code_01 (str): Formatted code describing the win
+            - winlines (tuple): Extracted winline data
+            - spinWins (tuple): Tuple containing the win amount
+
+    Example:
+        >>> pay_table = {3: {1: 30}}
+        >>> evaluate_line([0, 1, 1, 2, 3], 1, frozenset([0]), pay_table)
+        (30, 'B-3-1-1', (1, 3, 1, 30), (30,))
+    """
+    wild_set = _wild_set_for(wild_ids)
+    line_len = len(line)
+
+    # Single fused scan: wild classification, first-non-wild search, run
+    # extension, and wild-presence tracking in one loop
+    first_non_wild = line_len
+    symbol_to_match = -1
+    sequence_length = 0
+    wild_in_run = False
+    for i, symbol in enumerate(line):
+        is_wild = symbol in wild_set
+        if first_non_wild == line_len:
+            if is_wild:
+                wild_in_run = True
+            else:
+                first_non_wild = i
+                symbol_to_match = int(symbol)
+                sequence_length = 1
+        elif is_wild or symbol == symbol_to_match:
+            sequence_length += 1
+            wild_in_run = wild_in_run or is_wild
+        else:
+            break
+
+    # All wilds case
+    if first_non_wild == line_len:
+        symbol_to_match = int(line[0])
+        win = _payout(pay_table, line_len, symbol_to_match)
+        code_t = (0, line_len, 1, symbol_to_match)
+        code_01 = format_code(code_t)
+
+        winlines, spinWins = _extract_winline_spinwin_data_fast(line_id, code_t, win)
+        return win, code_01, winlines, spinWins
+
+    total_length = sequence_length + first_non_wild
+    main_win = _payout(pay_table, total_length, symbol_to_match)
+    code_t = (0, total_length, 1 if wild_in_run else 0, symbol_to_match)
+
+    # A leading all-wild prefix of length >= 2 may pay more on its own
+    if first_non_wild >= 2:
+        first_symbol = int(line[0])
+        alt_win = _payout(pay_table, first_non_wild, first_symbol)
+        if alt_win > main_win:
+            code_t = (0, first_non_wild, 1, first_symbol)
+            code_01 = format_code(code_t)
+
+            winlines, spinWins = _extract_winline_spinwin_data_fast(line_id, code_t, alt_win)
+            return alt_win, code_01, winlines, spinWins
+
+    code_01 = format_code(code_t)
+    winlines, spinWins = _extract_winline_spinwin_data_fast(line_id, code_t, main_win)
+
+    return main_win, code_01, winlines, spinWins
+
+
+# Specialized check_win closures keyed on (reel_count, pay-table identity,
+# wild set); the compiled pay array is kept for the identity check
+_SPECIALIZED_CACHE: Dict[
+    Tuple[int, int, FrozenSet[int]], Tuple[np.ndarray, Callable]
+] = {}
+
+
+def make_check_win(
+    reel_count: int,
+    pay_table: Union[Dict[int, Dict[int, float]], np.ndarray],
+    wild_ids: WildIds
+) -> Callable[[Line, int], Tuple[float, str, Tuple[Union[int, float], ...], Tuple[float, ...]]]:
+    """
+    Build a check_win specialized for a fixed reel count at game setup.
+
+    A production game fixes its reel count, pay table, and wild set once at
+    startup, so the generic scan keeps re-paying for loop bookkeeping and
+    bounds checks that never change. This factory generates a fully
+    unrolled scan with the wild set, pay-table bounds, and reel positions
+    baked in as constants (lengths that cannot pay are folded away at
+    build time), and returns a ``check(line, line_id)`` closure producing
+    the same result tuple as check_win. Generated closures are cached per
+    (reel_count, pay table, wild set), so the exec cost is paid once.
+
+    Args:
+        reel_count (int): Fixed number of reels per payline (must be >= 1)
+        pay_table (Union[Dict, np.ndarray]): Nested dict mapping
+                                              [sequence_length][symbol_id] -> payout,
+                                              or a dense array from compile_pay_table
+        wild_ids (WildIds): Symbol IDs that are considered wild
+
+    Returns:
+        Callable: ``check(line, line_id)`` returning
+        (win, code_01, winlines, spinWins) exactly like check_win
+
+    Example:
+        >>> check = make_check_win(5, {3: {2: 30}}, frozenset([5]))
+        >>> check([2, 2, 2, 1, 3], 1)
+        (30.0, 'B-3-0-2', (1, 3, 2, 30.0), (30.0,))
+    """
+    if reel_count < 1:
+        raise ValueError("reel_count must be >= 1")
+
+    pay_arr = compile_pay_table(pay_table)
+    wild_set = frozenset(wild_ids)
+    key = (reel_count, id(pay_arr), wild_set)
+    cached = _SPECIALIZED_CACHE.get(key)
+    if cached is not None and cached[0] is pay_arr:
+        return cached[1]
+
+    max_length = pay_arr.shape[0] - 1
+    max_symbol = pay_arr.shape[1] - 1
+    n = reel_count
+
+    src = [f"def _scan_{n}(line):"]
+    emit = src.append
+    for i in range(n):
+        emit(f"    s{i} = line[{i}]")
+        emit(f"    w{i} = s{i} in _wilds")
+
+    # All-wild line: length is the constant reel count, so the length bound
+    # is resolved here instead of at run time
+    emit("    if " + " and ".join(f"w{i}" for i in range(n)) + ":")
+    if n > max_length:
+        emit(f"        return 0.0, (0, {n}, 1, s0)")
+    else:
+        emit(f"        win = float(_pay[{n}, s0]) if 0 <= s0 <= {max_symbol} else 0.0")
+        emit(f"        return win, (0, {n}, 1, s0)")
+
+    for k in range(n):
+        if k == 0:
+            emit("    if not w0:")
+        elif k < n - 1:
+            emit(f"    elif not w{k}:")
+        else:
+            emit("    else:")
+        emit(f"        sym = s{k}")
+        # Branchless run count: chained 0/1 products carry the run state
+        prev = None
+        terms = []
+        for i in range(k + 1, n):
+            cur = f"m{i}"
+            base = f"w{i} or s{i} == sym"
+            emit(f"        {cur} = {base}" if prev is None
+                 else f"        {cur} = {prev} * ({base})")
+            terms.append(cur)
+            prev = cur
+        length_expr = " + ".join([str(k + 1)] + terms)
+        emit(f"        length = {length_expr}")
+        if k == 0:
+            wild_terms = " or ".join(f"(m{i} and w{i})" for i in range(1, n))
+            emit(f"        flag = 1 if {wild_terms} else 0" if wild_terms
+                 else "        flag = 0")
+        else:
+            # A leading wild guarantees wild presence
+            emit("        flag = 1")
+        emit(
+            f"        win = float(_pay[length, sym]) "
+            f"if length <= {max_length} and 0 <= sym <= {max_symbol} else 0.0"
+        )
+        if k >= 2 and k <= max_length:
+            # Leading all-wild prefix of constant length k as the alternative
+            emit(f"        alt = float(_pay[{k}, s0]) if 0 <= s0 <= {max_symbol} else 0.0")
+            emit("        if alt > win:")
+            emit(f"            return alt, (0, {k}, 1, s0)")
+        emit("        return win, (0, length, flag, sym)")
+
+    namespace = {"_pay": pay_arr, "_wilds": wild_set}
+    exec("\n".join(src), namespace)
+    scan = namespace[f"_scan_{n}"]
+
+    def check(line, line_id):
+        win, code_t = scan(line)
+        code_01 = format_code(code_t)
+        winlines, spinWins = _extract_winline_spinwin_data_fast(line_id, code_t, win)
+        return win, code_01, winlines, spinWins
+
+    _SPECIALIZED_CACHE[key] = (pay_arr, check)
+    return check
+
+
+def _scan_line_py(line: List[int], wilds: List[bool]) -> Tuple[int, int, int]:
+    """
+    Scan a payline for the leading winning run (pure-Python fallback).
+
+    Returns:
+        Tuple of (first_non_wild, sequence_length, symbol_to_match); an
+        all-wild line yields (line_len, 0, -1).
+    """
+    line_len = len(line)
+
+    # Single pass: target resolution (first non-wild symbol) and run
+    # counting are folded into one loop instead of scanning the leading
+    # wilds twice
+    first_non_wild = line_len
+    symbol_to_match = -1
+    sequence_length = 0
+    for i in range(line_len):
+        if first_non_wild == line_len:
+            if not wilds[i]:
+                first_non_wild = i
+                symbol_to_match = line[i]
+                sequence_length = 1
+        elif wilds[i] or line[i] == symbol_to_match:
+            sequence_length += 1
+        else:
+            break
+
+    return first_non_wild, sequence_length, symbol_to_match
+
+
+def _scan_line_5(line: List[int], wilds: List[bool]) -> Tuple[int, int, int]:
+    """
+    Fully unrolled scan for the dominant 5-reel payline shape.
+
+    Same contract as _scan_line_py but with no range objects, no loop
+    bookkeeping, and no break: just straight-line comparisons, which is the
+    overwhelmingly common case in production slot configurations.
+    """
+    w0, w1, w2, w3, w4 = wilds
+
+    if w0 and w1 and w2 and w3 and w4:
+        return 5, 0, -1
+
+    if not w0:
+        # Dominant shape: no leading wild. The run length is computed with
+        # branchless boolean arithmetic — each product is 1 only while every
+        # earlier position matched, so the sum is the leading run length
+        symbol_to_match = line[0]
+        m1 = w1 or line[1] == symbol_to_match
+        m2 = m1 * (w2 or line[2] == symbol_to_match)
+        m3 = m2 * (w3 or line[3] == symbol_to_match)
+        m4 = m3 * (w4 or line[4] == symbol_to_match)
+        return 0, 1 + m1 + m2 + m3 + m4, symbol_to_match
+
+    if not w1:
+        first_non_wild = 1
+    elif not w2:
+        first_non_wild = 2
+    elif not w3:
+        first_non_wild = 3
+    else:
+        first_non_wild = 4
+
+    symbol_to_match = line[first_non_wild]
+    sequence_length = 1
+    i = first_non_wild + 1
+    if i < 5 and (wilds[i] or line[i] == symbol_to_match):
+        sequence_length = 2
+        i += 1
+        if i < 5 and (wilds[i] or line[i] == symbol_to_match):
+            sequence_length = 3
+            i += 1
+            if i < 5 and (wilds[i] or line[i] == symbol_to_match):
+                sequence_length = 4
+                i += 1
+                if i < 5 and (wilds[i] or line[i] == symbol_to_match):
+                    sequence_length = 5
+
+    return first_non_wild, sequence_length, symbol_to_match
+
+
+# Specialized scans dispatched by line length; generic lengths fall back to
+# the loop-based scan
+_SCAN_SPECIAL = {5: _scan_line_5}
+
+
+def _check_win_kernel(
+    line_i32: np.ndarray, wilds_u8: np.ndarray, pay_arr: np.ndarray
+) -> Tuple[float, int, int, int]:
+    """
+    Complete win computation over typed arrays: scan, dense pay-table
+    lookup, all-wild handling, and the leading-wild alternative pattern.
+
+    Written over an int32 line, uint8 wilds mask, and a compiled dense pay
+    table so numba can compile the whole thing to native code; without
+    numba it runs as plain Python with identical results.
+
+    Returns:
+        Tuple of (win, length, wild_flag, symbol_to_match).
+    """
+    line_len = line_i32.shape[0]
+    max_length = pay_arr.shape[0] - 1
+    max_symbol = pay_arr.shape[1] - 1
+
+    first_non_wild = line_len
+    for i in range(line_len):
+        if wilds_u8[i] == 0:
+            first_non_wild = i
+            break
+
+    first_symbol = line_i32[0]
+
+    if first_non_wild == line_len:
+        # All wilds: pays on the first symbol over the full line
+        if line_len <= max_length and 0 <= first_symbol <= max_symbol:
+            win = pay_arr[line_len, first_symbol]
+        else:
+            win = 0.0
+        return win, line_len, 1, first_symbol
+
+    symbol_to_match = line_i32[first_non_wild]
+    sequence_length = 1
+    wild_flag = 1 if first_non_wild > 0 else 0
+    for i in range(first_non_wild + 1, line_len):
+        if wilds_u8[i] != 0:
+            sequence_length += 1
+            wild_flag = 1
+        elif line_i32[i] == symbol_to_match:
+            sequence_length += 1
+        else:
+            break
+
+    length = first_non_wild + sequence_length
+    if length <= max_length and 0 <= symbol_to_match <= max_symbol:
+        win = pay_arr[length, symbol_to_match]
+    else:
+        win = 0.0
+
+    # A leading all-wild prefix of length >= 2 may pay more on its own
+    if (
+        first_non_wild >= 2
+        and first_non_wild <= max_length
+        and 0 <= first_symbol <= max_symbol
+    ):
+        alt_win = pay_arr[first_non_wild, first_symbol]
+        if alt_win > win:
+            return alt_win, first_non_wild, 1, first_symbol
+
+    return win, length, wild_flag, symbol_to_match
+
+
+if _HAVE_NUMBA:
+    _check_win_kernel = _njit(cache=True)(_check_win_kernel)
+
+
+# Strong references to pay tables seen by the memoized check_win path; the
+# cache keys on id(pay_table), so the object must stay alive while cached.
+# Lines longer than the cap skip memoization to keep cache keys small
+_PAY_TABLE_REGISTRY: Dict[int, Union[Dict[int, Dict[int, float]], np.ndarray]] = {}
+_WIN_CACHE_MAX_LINE_LEN = 8
+
+
+def check_win(
+    line: Line,
+    line_id: int,
     wilds: List[bool],
-    wild_ids: List[int],
-    pay_table: Dict[int, Dict[int, float]]
-) -> Tuple[float, str, List[Union[int, float]], List[float]]:
+    wild_ids: WildIds,
+    pay_table: Union[Dict[int, Dict[int, float]], np.ndarray]
+) -> Tuple[float, str, Tuple[Union[int, float], ...], Tuple[float, ...]]:
     """
     Calculate winning combinations and payouts for a given payline.
     
@@ -218,20 +1283,25 @@ def check_win(
     combination possible on the line.
     
     Args:
-        line (List[int]): List of symbol IDs on the payline
+        line (Line): Symbol IDs on the payline; an int32 ndarray or
+                     array.array avoids boxing and takes the compiled scan
         line_id (int): Unique identifier for this payline
         wilds (List[bool]): Boolean mask indicating wild positions (from check_wild_symbols)
-        wild_ids (List[int]): List of symbol IDs that are considered wild
-        pay_table (Dict[int, Dict[int, float]]): Nested dict mapping 
-                                                  [sequence_length][symbol_id] -> payout
-    
+        wild_ids (WildIds): Symbol IDs that are considered wild; a reused
+                            frozenset gives O(1) membership on the hot path
+        pay_table (Union[Dict, np.ndarray]): Nested dict mapping
+                                              [sequence_length][symbol_id] -> payout,
+                                              or a dense array from compile_pay_table.
+                                              Treated as immutable: results for short
+                                              lines are memoized per table identity
+
     Returns:
         Tuple containing:
             - win (float): The calculated win amount
             - code_01 (str): Formatted code describing the win
-            - winlines (List): Extracted winline data
-            - spinWins (List[float]): List containing the win amount
-    
+            - winlines (tuple): Extracted winline data
+            - spinWins (tuple): Tuple containing the win amount
+
     Win Detection Logic:
         1. All wilds: Pays based on the first wild symbol
         2. Mixed symbols: Finds longest sequence of matching symbols (with wild substitution)
@@ -256,71 +1326,107 @@ def check_win(
                 5: {0: 200, 1: 120, 2: 100, 3: 80, 4: 60}
             }
         >>> win, code, winlines, spinWins = sgu.check_win(line, line_id, wilds, wild_ids, payTable)
-        (20, 'B-3-0-3', [2, 3, 3, 20], [20])
+        (20, 'B-3-0-3', (2, 3, 3, 20), (20,))
+    """
+    # Typed buffers convert to ndarrays through the buffer protocol (no
+    # per-element boxing) and then share the compiled scan path
+    if isinstance(line, array.array):
+        line = np.asarray(line)
+
+    # Compile the pay table once per game (cached per dict identity), so
+    # every payout below is a single indexed load instead of two dict probes
+    pay_table = _auto_compile(pay_table)
+
+    # Short list lines recur constantly in simulation workloads, so their
+    # pure scan result is memoized on (line, wilds, pay_table identity)
+    if isinstance(line, list) and len(line) <= _WIN_CACHE_MAX_LINE_LEN:
+        pt_key = id(pay_table)
+        registered = _PAY_TABLE_REGISTRY.get(pt_key)
+        if registered is not pay_table:
+            if registered is not None:
+                # A recycled id means stale cache entries for this key
+                _check_win_cached.cache_clear()
+            _PAY_TABLE_REGISTRY[pt_key] = pay_table
+        win, code_t = _check_win_cached(tuple(line), tuple(wilds), pt_key)
+    else:
+        win, code_t = _check_win_core(line, wilds, pay_table)
+
+    code_01 = format_code(code_t)
+    winlines, spinWins = _extract_winline_spinwin_data_fast(line_id, code_t, win)
+
+    return win, code_01, winlines, spinWins
+
+
+def _check_win_core(
+    line: Line,
+    wilds: Union[List[bool], Tuple[bool, ...]],
+    pay_table: Union[Dict[int, Dict[int, float]], np.ndarray]
+) -> Tuple[float, CodeTuple]:
+    """
+    Pure win computation shared by check_win's cached and direct paths.
+
+    Returns:
+        Tuple of (win, code_tuple) with no per-line formatting or output
+        structure allocation.
     """
     line_len = len(line)
-    
-    # Find position of first non-wild symbol
-    first_non_wild = line_len
-    for i in range(line_len):
-        if not wilds[i]:
-            first_non_wild = i
-            break
-    
+
+    # Typed array inputs take the numba-compiled kernel over a dense pay
+    # table: scan, lookup, and the alternative pattern in one native call.
+    # Tables too sparse to compile fall through to the scalar scan instead
+    pay_arr = _auto_compile(pay_table)
+    if isinstance(line, np.ndarray) and isinstance(pay_arr, np.ndarray):
+        win, length, wild_flag, symbol = _check_win_kernel(
+            np.ascontiguousarray(line, dtype=np.int32),
+            np.asarray(wilds, dtype=np.uint8),
+            pay_arr,
+        )
+        return float(win), (0, int(length), int(wild_flag), int(symbol))
+
+    # Scan for the first non-wild symbol and the leading matching run. The
+    # symbol and run count are coerced to plain ints: typed lines yield
+    # NumPy scalars, which overflow the flat-key packing and leak into the
+    # winlines tuple
+    scan = _SCAN_SPECIAL.get(line_len, _scan_line_py)
+    first_non_wild, sequence_length, symbol_to_match = scan(line, wilds)
+    symbol_to_match = int(symbol_to_match)
+    sequence_length = int(sequence_length)
+
     # All wilds case
     if first_non_wild == line_len:
-        symbol_to_match = line[0]
-        try:
-            win = pay_table[line_len][symbol_to_match]
-        except Exception as e:
-            print(f"Error in extract_winline_spinwin_data (main) payTable key error: {e}")
-            win = 0
-        code_01 = f"B-{str(line_len)}-1-{str(symbol_to_match)}"
-        
-        winlines, spinWins = extract_winline_spinwin_data(line_id, code_01, win)
-        return win, code_01, winlines, spinWins
-    
-    # First symbol is the symbol to match for wilds
-    symbol_to_match = line[first_non_wild]
-    
-    # Find the longest sequence of matching symbols or wilds
-    sequence_length = 1
-    for i in range(first_non_wild + 1, line_len):
-        if wilds[i] or line[i] == symbol_to_match:
-            sequence_length += 1
-        else:
-            break
-    
+        symbol_to_match = int(line[0])
+        win = _payout(pay_table, line_len, symbol_to_match)
+        return win, (0, line_len, 1, symbol_to_match)
+
     # Calculate win for this sequence
-    try:
-        main_win = pay_table[sequence_length + first_non_wild][symbol_to_match]
-    except Exception as e:
-        print(f"Error in extract_winline_spinwin_data (main) payTable key error: {e}")
-        main_win = 0
-    wild_presence = check_wild_presence(line[0:sequence_length + first_non_wild], wild_ids)
-    code_01 = f"B-{str(sequence_length + first_non_wild)}-{str(wild_presence)}-{str(symbol_to_match)}"
-    
+    main_win = _payout(pay_table, sequence_length + first_non_wild, symbol_to_match)
+    # Wild presence is already known from the wilds mask: any leading wilds,
+    # or a wild inside the matched run (line[first_non_wild] is non-wild)
+    wild_presence = 1 if first_non_wild > 0 or any(
+        wilds[first_non_wild + 1:first_non_wild + sequence_length]
+    ) else 0
+    code_t = (0, sequence_length + first_non_wild, wild_presence, symbol_to_match)
+
     # Check for alternative win patterns based on original logic
     if first_non_wild > 0:
         # Try using the first symbol with wilds
-        first_symbol = line[0]
-        
+        first_symbol = int(line[0])
+
         wild_sequence = first_non_wild
-        
+
         if wild_sequence >= 2:  # Need at least 2 for a win
-            try:
-                alt_win = pay_table[wild_sequence][first_symbol]
-            except Exception as e:
-                print(f"Error in extract_winline_spinwin_data (main) payTable key error: {e}")
-                alt_win = 0
+            alt_win = _payout(pay_table, wild_sequence, first_symbol)
             # Compare with main win, take the higher value
             if alt_win > main_win:
-                wild_presence = check_wild_presence(line[0:wild_sequence], wild_ids)
-                code_01 = f"B-{str(wild_sequence)}-{str(wild_presence)}-{str(first_symbol)}"
-                
-                winlines, spinWins = extract_winline_spinwin_data(line_id, code_01, alt_win)
-                return alt_win, code_01, winlines, spinWins
-    
-    winlines, spinWins = extract_winline_spinwin_data(line_id, code_01, main_win)
-    
-    return main_win, code_01, winlines, spinWins
\ No newline at end of file
+                # The alternative prefix is wilds only, so presence is certain
+                return alt_win, (0, wild_sequence, 1, first_symbol)
+
+    return main_win, code_t
+
+
+@lru_cache(maxsize=2 ** 16)
+def _check_win_cached(
+    line_t: Tuple[int, ...], wilds_t: Tuple[bool, ...], pt_key: int
+) -> Tuple[float, CodeTuple]:
+    """Memoized _check_win_core keyed on line, wilds, and pay-table identity."""
+    return _check_win_core(line_t, wilds_t, _PAY_TABLE_REGISTRY[pt_key])
\ No newline at end of file
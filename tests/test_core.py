@@ -6,10 +6,20 @@ import pytest
 import numpy as np
 from slot_game_utils import (
     extract_winline_spinwin_data,
+    extract_winlines_batch,
     extract_game_detail,
+    extract_spin_winlines,
+    build_wild_lut,
     check_wild_symbols,
+    check_wild_symbols_lut,
     check_wild_presence,
     check_win,
+    check_wins_batch,
+    compile_pay_table,
+    flatten_pay_table,
+    evaluate_line,
+    format_code,
+    make_check_win,
 )
 
 
@@ -24,8 +34,8 @@ class TestExtractWinlineSpinwinData:
         
         winlines, spin_wins = extract_winline_spinwin_data(winline_id, code, win_amount)
         
-        assert winlines == [1, 3, 2, 50.0]
-        assert spin_wins == [50.0]
+        assert winlines == (1, 3, 2, 50.0)
+        assert spin_wins == (50.0,)
     
     def test_invalid_code_format(self):
         """Test handling of invalid code format."""
@@ -35,8 +45,8 @@ class TestExtractWinlineSpinwinData:
         
         winlines, spin_wins = extract_winline_spinwin_data(winline_id, code, win_amount)
         
-        assert winlines == []
-        assert spin_wins == [50.0]
+        assert winlines == ()
+        assert spin_wins == (50.0,)
     
     def test_code_with_wild_win(self):
         """Test code indicating win by wild."""
@@ -46,8 +56,8 @@ class TestExtractWinlineSpinwinData:
         
         winlines, spin_wins = extract_winline_spinwin_data(winline_id, code, win_amount)
         
-        assert winlines == [5, 5, 10, 100.0]
-        assert spin_wins == [100.0]
+        assert winlines == (5, 5, 10, 100.0)
+        assert spin_wins == (100.0,)
     
     def test_non_numeric_values_in_code(self):
         """Test handling of non-numeric values in code."""
@@ -57,8 +67,8 @@ class TestExtractWinlineSpinwinData:
         
         winlines, spin_wins = extract_winline_spinwin_data(winline_id, code, win_amount)
         
-        assert winlines == []
-        assert spin_wins == [25.0]
+        assert winlines == ()
+        assert spin_wins == (25.0,)
     
     def test_edge_case_zero_values(self):
         """Test with zero values."""
@@ -68,8 +78,70 @@ class TestExtractWinlineSpinwinData:
         
         winlines, spin_wins = extract_winline_spinwin_data(winline_id, code, win_amount)
         
-        assert winlines == [0, 0, 0, 0.0]
-        assert spin_wins == [0.0]
+        assert winlines == (0, 0, 0, 0.0)
+        assert spin_wins == (0.0,)
+
+
+class TestExtractWinlinesBatch:
+    """Test cases for extract_winlines_batch function."""
+
+    def test_tuple_codes(self):
+        """Test batch extraction from internal code tuples."""
+        winlines, spin_wins = extract_winlines_batch(
+            [1, 2], [(0, 3, 0, 2), (0, 4, 1, 1)], [30.0, 60.0]
+        )
+
+        assert winlines.tolist() == [[1, 3, 2, 30.0], [2, 4, 1, 60.0]]
+        assert spin_wins.tolist() == [30.0, 60.0]
+
+    def test_string_codes(self):
+        """Test batch extraction from legacy string codes."""
+        winlines, spin_wins = extract_winlines_batch(
+            [1, 2], ["B-3-0-02-1", "TF-5-1-10-2"], [50.0, 100.0]
+        )
+
+        assert winlines.tolist() == [[1, 3, 2, 50.0], [2, 5, 10, 100.0]]
+        assert spin_wins.tolist() == [50.0, 100.0]
+
+    def test_invalid_string_rows_dropped(self):
+        """Test invalid codes drop their winline row but keep the amount."""
+        winlines, spin_wins = extract_winlines_batch(
+            [1, 2], ["INVALID", "B-3-0-2-1"], [25.0, 30.0]
+        )
+
+        assert winlines.tolist() == [[2, 3, 2, 30.0]]
+        assert spin_wins.tolist() == [25.0, 30.0]
+
+    def test_empty_batch(self):
+        """Test an empty batch yields empty arrays."""
+        winlines, spin_wins = extract_winlines_batch([], [], [])
+
+        assert winlines.shape == (0, 4)
+        assert spin_wins.shape == (0,)
+
+
+class TestFormatCode:
+    """Test cases for format_code function."""
+
+    def test_base_game_code(self):
+        """Test formatting of a base-game code tuple."""
+        assert format_code((0, 3, 0, 2)) == "B-3-0-2"
+
+    def test_wild_win_code(self):
+        """Test formatting of a wild-win code tuple."""
+        assert format_code((0, 5, 1, 5)) == "B-5-1-5"
+
+    def test_free_spin_kind(self):
+        """Test formatting of a free-spin code tuple."""
+        assert format_code((1, 4, 1, 10)) == "TF-4-1-10"
+
+    def test_round_trip_through_parser(self):
+        """Test formatted codes parse back through the string API."""
+        code = format_code((0, 3, 0, 2))
+
+        winlines, spin_wins = extract_winline_spinwin_data(7, code, 30.0)
+
+        assert winlines == (7, 3, 2, 30.0)
 
 
 class TestExtractGameDetail:
@@ -128,6 +200,30 @@ class TestExtractGameDetail:
         assert result["reels"] == [1, 2, 3, 4, 5]
         assert result["spinWins"] == [75.0]
     
+    def test_ndarray_matrix(self):
+        """Test flattening of an ndarray matrix."""
+        matrix = np.array([[1, 2, 3], [4, 5, 6]], dtype=np.int32)
+
+        result = extract_game_detail(50.0, "normal", matrix, [], [50.0])
+
+        assert result["reels"] == [1, 2, 3, 4, 5, 6]
+
+    def test_list_of_ndarray_rows(self):
+        """Test flattening of a matrix given as a list of ndarray rows."""
+        matrix = [np.array([1, 2, 3]), np.array([4, 5, 6])]
+
+        result = extract_game_detail(50.0, "normal", matrix, [], [50.0])
+
+        assert result["reels"] == [1, 2, 3, 4, 5, 6]
+
+    def test_ragged_matrix(self):
+        """Test flattening of a ragged list-of-lists matrix."""
+        matrix = [[1, 2, 3], [4, 5]]
+
+        result = extract_game_detail(0.0, "normal", matrix, [], [])
+
+        assert result["reels"] == [1, 2, 3, 4, 5]
+
     def test_large_matrix(self):
         """Test with larger matrix."""
         matrix = [[i+j for j in range(5)] for i in range(5)]
@@ -194,6 +290,42 @@ class TestCheckWildSymbols:
         
         assert result == [False, False, False, False, False]
     
+    def test_frozenset_wild_ids(self):
+        """Test wild_ids passed as a frozenset."""
+        line = [1, 5, 3, 5, 2]
+        wild_ids = frozenset([5, 10])
+
+        result = check_wild_symbols(line, wild_ids)
+
+        assert result == [False, True, False, True, False]
+
+    def test_ndarray_line_returns_ndarray_mask(self):
+        """Test ndarray input stays vectorized end to end."""
+        line = np.array([1, 5, 3, 5, 2])
+        wild_ids = [5, 10]
+
+        result = check_wild_symbols(line, wild_ids)
+
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == [False, True, False, True, False]
+
+    def test_ndarray_line_many_wild_ids(self):
+        """Test ndarray input with a large wild set takes the isin path."""
+        line = np.array([1, 5, 3, 7, 2])
+        wild_ids = [5, 7, 9, 11, 13]
+
+        result = check_wild_symbols(line, wild_ids)
+
+        assert result.tolist() == [False, True, False, True, False]
+
+    def test_ndarray_line_empty_wild_ids(self):
+        """Test ndarray input with no wild IDs."""
+        line = np.array([1, 2, 3])
+
+        result = check_wild_symbols(line, [])
+
+        assert result.tolist() == [False, False, False]
+
     def test_single_wild_id(self):
         """Test with single wild ID."""
         line = [1, 2, 1, 2, 1]
@@ -204,6 +336,41 @@ class TestCheckWildSymbols:
         assert result == [True, False, True, False, True]
 
 
+class TestWildLut:
+    """Test cases for build_wild_lut and check_wild_symbols_lut."""
+
+    def test_build_wild_lut(self):
+        """Test LUT construction marks only wild IDs."""
+        lut = build_wild_lut([0, 2], 4)
+
+        assert lut.tolist() == [True, False, True, False, False]
+
+    def test_build_wild_lut_empty(self):
+        """Test LUT with no wild IDs is all False."""
+        lut = build_wild_lut([], 3)
+
+        assert lut.tolist() == [False, False, False, False]
+
+    def test_check_wild_symbols_lut(self):
+        """Test LUT-based wild classification returns an ndarray mask."""
+        lut = build_wild_lut([5, 10], 10)
+        line = np.array([1, 5, 3, 10, 2])
+
+        mask = check_wild_symbols_lut(line, lut)
+
+        assert isinstance(mask, np.ndarray)
+        assert mask.tolist() == [False, True, False, True, False]
+
+    def test_lut_matches_check_wild_symbols(self):
+        """Test LUT path agrees with the legacy list API."""
+        line = [1, 5, 3, 5, 2]
+        wild_ids = [5, 10]
+        lut = build_wild_lut(wild_ids, 10)
+
+        assert check_wild_symbols_lut(np.array(line), lut).tolist() == \
+            check_wild_symbols(line, wild_ids)
+
+
 class TestCheckWildPresence:
     """Test cases for check_wild_presence function."""
     
@@ -261,6 +428,15 @@ class TestCheckWildPresence:
         
         assert result == 1
     
+    def test_frozenset_wild_ids(self):
+        """Test wild_ids passed as a frozenset."""
+        line = [1, 2, 3, 4]
+        wild_ids = frozenset([3, 5])
+
+        result = check_wild_presence(line, wild_ids)
+
+        assert result == 1
+
     def test_multiple_wild_types(self):
         """Test with multiple different wild symbols."""
         line = [1, 2, 3, 4, 5, 6]
@@ -297,8 +473,8 @@ class TestCheckWin:
         
         assert win == 30  # 3 symbols of type 2
         assert code == "B-3-0-2"
-        assert winlines == [1, 3, 2, 30]
-        assert spinWins == [30]
+        assert winlines == (1, 3, 2, 30)
+        assert spinWins == (30,)
     
     def test_win_with_wilds(self, sample_pay_table):
         """Test win with wild substitution."""
@@ -313,8 +489,8 @@ class TestCheckWin:
         
         assert win == 30  # Wild + 2 symbols of type 2
         assert code == "B-3-1-2"
-        assert winlines == [2, 3, 2, 30]
-        assert spinWins == [30]
+        assert winlines == (2, 3, 2, 30)
+        assert spinWins == (30,)
     
     def test_all_wilds(self, sample_pay_table):
         """Test win with all wild symbols."""
@@ -329,8 +505,8 @@ class TestCheckWin:
         
         assert win == 250  # 5 wilds
         assert code == "B-5-1-5"
-        assert winlines == [3, 5, 5, 250]
-        assert spinWins == [250]
+        assert winlines == (3, 5, 5, 250)
+        assert spinWins == (250,)
     
     def test_alternative_wild_pattern(self, sample_pay_table):
         """Test alternative wild pattern win."""
@@ -405,6 +581,93 @@ class TestCheckWin:
         assert win == 80  # 4 symbols of type 3
         assert code == "B-4-0-3"
     
+    def test_three_reel_line(self, sample_pay_table):
+        """Test non-5-reel lines take the generic scan path."""
+        line = [2, 2, 2]
+        wilds = [False, False, False]
+
+        win, code, winlines, spinWins = check_win(
+            line, 1, wilds, [5], sample_pay_table
+        )
+
+        assert win == 30
+        assert code == "B-3-0-2"
+
+    def test_ndarray_line_matches_list_path(self, sample_pay_table):
+        """Test typed-array lines take the compiled scan with equal results."""
+        line = [5, 2, 2, 1, 3]
+        wilds = [True, False, False, False, False]
+        wild_ids = [5]
+
+        expected = check_win(line, 2, wilds, wild_ids, sample_pay_table)
+        result = check_win(
+            np.array(line, dtype=np.int32), 2, wilds, wild_ids, sample_pay_table
+        )
+
+        assert result == expected
+
+    def test_ndarray_line_wild_run_beyond_table(self):
+        """Test a leading wild run longer than the pay table's max length."""
+        pay_table = {2: {1: 10}, 3: {1: 30}}
+        line = [0, 0, 0, 0, 2]
+        wilds = [True, True, True, True, False]
+        wild_ids = [0]
+
+        expected = check_win(line, 1, wilds, wild_ids, pay_table)
+        result = check_win(
+            np.array(line, dtype=np.int32), 1, wilds, wild_ids, pay_table
+        )
+
+        assert expected[0] == 0
+        assert result == expected
+
+    def test_array_array_line(self, sample_pay_table):
+        """Test typed array.array lines match the list path."""
+        import array
+
+        line = [2, 2, 2, 1, 3]
+        wilds = [False] * 5
+
+        expected = check_win(line, 1, wilds, [5], sample_pay_table)
+        result = check_win(array.array('i', line), 1, wilds, [5], sample_pay_table)
+
+        assert result == expected
+
+    def test_ndarray_all_wilds(self, sample_pay_table):
+        """Test all-wild ndarray line."""
+        line = np.array([5, 5, 5, 5, 5], dtype=np.int32)
+        wilds = [True] * 5
+
+        win, code, winlines, spinWins = check_win(
+            line, 3, wilds, [5], sample_pay_table
+        )
+
+        assert win == 250
+        assert code == "B-5-1-5"
+
+    def test_repeated_calls_hit_cache(self, sample_pay_table):
+        """Test repeated identical calls return consistent results."""
+        line = [2, 2, 2, 1, 3]
+        wilds = [False] * 5
+
+        first = check_win(line, 1, wilds, [5], sample_pay_table)
+        second = check_win(line, 1, wilds, [5], sample_pay_table)
+
+        assert first == second
+
+    def test_cache_keyed_per_pay_table(self):
+        """Test distinct pay tables do not share cached results."""
+        line = [2, 2, 2, 1, 3]
+        wilds = [False] * 5
+        table_a = {3: {2: 30}}
+        table_b = {3: {2: 99}}
+
+        win_a, _, _, _ = check_win(line, 1, wilds, [5], table_a)
+        win_b, _, _, _ = check_win(line, 1, wilds, [5], table_b)
+
+        assert win_a == 30
+        assert win_b == 99
+
     def test_single_symbol_no_win(self, sample_pay_table):
         """Test single symbol doesn't create a win."""
         line = [1, 2, 3, 4, 5]
@@ -419,6 +682,323 @@ class TestCheckWin:
         assert win == 0  # Only 1 symbol, minimum is 2
 
 
+class TestCompilePayTable:
+    """Test cases for compile_pay_table function."""
+
+    def test_dense_layout(self):
+        """Test dict entries land at [length, symbol] with zeros elsewhere."""
+        pay_table = {2: {0: 10.0, 1: 15.0}, 3: {1: 30.0}}
+
+        dense = compile_pay_table(pay_table)
+
+        assert dense.shape == (4, 2)
+        assert dense[2, 0] == 10.0
+        assert dense[2, 1] == 15.0
+        assert dense[3, 1] == 30.0
+        assert dense[3, 0] == 0.0
+
+    def test_compiled_table_is_cached(self):
+        """Test the same dict compiles to the same array object."""
+        pay_table = {2: {1: 10.0}}
+
+        assert compile_pay_table(pay_table) is compile_pay_table(pay_table)
+
+    def test_ndarray_passthrough(self):
+        """Test an already-compiled array is returned unchanged."""
+        dense = compile_pay_table({2: {1: 10.0}})
+
+        assert compile_pay_table(dense) is dense
+
+    def test_flatten_pay_table_layout(self):
+        """Test flat keys pack (length, symbol) into one int."""
+        flat = flatten_pay_table({3: {2: 30.0}, 4: {1: 60.0}})
+
+        assert flat == {(3 << 32) | 2: 30.0, (4 << 32) | 1: 60.0}
+
+    def test_sparse_table_stays_on_dict_path(self):
+        """Test check_win with symbol IDs too large to compile densely."""
+        pay_table = {3: {10_000_000: 40}}
+        line = [10_000_000, 10_000_000, 10_000_000, 1, 3]
+        wilds = [False] * 5
+
+        win, code, winlines, spinWins = check_win(line, 1, wilds, [], pay_table)
+
+        assert win == 40
+        assert code == "B-3-0-10000000"
+
+    def test_sparse_table_with_ndarray_line(self):
+        """Test an int32 ndarray line against a sparse dict-path table."""
+        pay_table = {3: {10_000_000: 40}}
+        line = np.array([10_000_000] * 3 + [1], dtype=np.int32)
+        wilds = [False] * 4
+
+        win, code, winlines, spinWins = check_win(line, 1, wilds, [], pay_table)
+
+        assert win == 40
+        assert code == "B-3-0-10000000"
+        assert winlines == (1, 3, 10_000_000, 40)
+        assert all(type(value) in (int, float) for value in winlines)
+
+    def test_check_win_accepts_compiled_table(self):
+        """Test check_win with a precompiled dense pay table."""
+        pay_table = {
+            2: {1: 10, 2: 15, 3: 20, 5: 25},
+            3: {1: 20, 2: 30, 3: 40, 5: 50},
+        }
+        dense = compile_pay_table(pay_table)
+        line = [2, 2, 2, 1, 3]
+        wilds = [False] * 5
+
+        win, code, winlines, spinWins = check_win(line, 1, wilds, [5], dense)
+
+        assert win == 30
+        assert code == "B-3-0-2"
+
+    def test_check_win_compiled_missing_entry(self):
+        """Test compiled table returns zero for out-of-range symbols."""
+        dense = compile_pay_table({2: {1: 10}})
+        line = [9, 9, 9, 9, 9]
+        wilds = [False] * 5
+
+        win, code, winlines, spinWins = check_win(line, 1, wilds, [5], dense)
+
+        assert win == 0
+
+
+class TestEvaluateLine:
+    """Test cases for evaluate_line function."""
+
+    @pytest.fixture
+    def sample_pay_table(self):
+        """Sample pay table for testing."""
+        return {
+            2: {1: 10, 2: 15, 3: 20, 5: 25},
+            3: {1: 20, 2: 30, 3: 40, 5: 50},
+            4: {1: 40, 2: 60, 3: 80, 5: 100},
+            5: {1: 100, 2: 150, 3: 200, 5: 250}
+        }
+
+    @pytest.mark.parametrize("line", [
+        [2, 2, 2, 1, 3],   # Regular win
+        [5, 2, 2, 1, 3],   # Win with leading wild
+        [5, 5, 5, 5, 5],   # All wilds
+        [5, 5, 3, 2, 1],   # Alternative wild pattern
+        [5, 1, 5, 1, 2],   # Mixed wilds and symbols
+        [1, 2, 3, 4, 5],   # No win
+        [9, 9, 9, 9, 9],   # Symbol missing from pay table
+    ])
+    def test_matches_chained_calls(self, sample_pay_table, line):
+        """Test the fused pass matches check_wild_symbols + check_win."""
+        wild_ids = frozenset([5])
+        wilds = check_wild_symbols(line, wild_ids)
+        expected = check_win(line, 1, wilds, wild_ids, sample_pay_table)
+
+        assert evaluate_line(line, 1, wild_ids, sample_pay_table) == expected
+
+    def test_list_wild_ids(self, sample_pay_table):
+        """Test evaluate_line normalizes list wild_ids internally."""
+        win, code, winlines, spinWins = evaluate_line(
+            [2, 2, 2, 1, 3], 1, [5], sample_pay_table
+        )
+
+        assert win == 30
+        assert code == "B-3-0-2"
+
+
+class TestExtractSpinWinlines:
+    """Test cases for extract_spin_winlines function."""
+
+    def test_winning_rows_compact(self):
+        """Test only winning lines appear in the winline matrix."""
+        lines = np.array([
+            [2, 2, 2, 1, 3],   # Win: B-3-0-2
+            [1, 2, 3, 4, 6],   # No win
+            [5, 2, 2, 1, 3],   # Win with leading wild: B-3-1-2
+        ])
+        pay_table = {3: {1: 20, 2: 30}, 4: {2: 60}}
+
+        winlines, spin_wins = extract_spin_winlines(lines, [5], pay_table)
+
+        assert winlines.tolist() == [[1, 3, 2, 30.0], [3, 3, 2, 30.0]]
+        assert spin_wins.tolist() == [30.0, 30.0]
+
+    def test_custom_line_ids(self):
+        """Test explicit line identifiers are carried through."""
+        lines = np.array([[2, 2, 2, 1, 3]])
+
+        winlines, _ = extract_spin_winlines(
+            lines, [5], {3: {2: 30}}, line_ids=np.array([42])
+        )
+
+        assert winlines.tolist() == [[42, 3, 2, 30.0]]
+
+    def test_no_wins(self):
+        """Test a spin without winning lines yields empty arrays."""
+        lines = np.array([[1, 2, 3, 4, 6]])
+
+        winlines, spin_wins = extract_spin_winlines(lines, [5], {3: {2: 30}})
+
+        assert winlines.shape == (0, 4)
+        assert spin_wins.shape == (0,)
+
+
+class TestMakeCheckWin:
+    """Test cases for the make_check_win specialization factory."""
+
+    @pytest.fixture
+    def sample_pay_table(self):
+        """Sample pay table for testing."""
+        return {
+            2: {1: 10, 2: 15, 3: 20, 5: 25},
+            3: {1: 20, 2: 30, 3: 40, 5: 50},
+            4: {1: 40, 2: 60, 3: 80, 5: 100},
+            5: {1: 100, 2: 150, 3: 200, 5: 250}
+        }
+
+    @pytest.mark.parametrize("line", [
+        [2, 2, 2, 1, 3],   # Regular win
+        [5, 2, 2, 1, 3],   # Win with leading wild
+        [5, 5, 5, 5, 5],   # All wilds
+        [5, 5, 3, 2, 1],   # Alternative wild pattern
+        [5, 1, 5, 1, 2],   # Mixed wilds and symbols
+        [1, 2, 3, 4, 5],   # No win
+        [9, 9, 9, 9, 9],   # Symbol missing from pay table
+    ])
+    def test_matches_check_win(self, sample_pay_table, line):
+        """Test the specialized closure matches generic check_win."""
+        wild_ids = frozenset([5])
+        check = make_check_win(5, sample_pay_table, wild_ids)
+
+        wilds = check_wild_symbols(line, wild_ids)
+        win, code, winlines, spinWins = check_win(
+            line, 1, wilds, wild_ids, sample_pay_table
+        )
+
+        spec_win, spec_code, spec_winlines, spec_spinWins = check(line, 1)
+        assert spec_win == win
+        assert spec_code == code
+        assert spec_winlines == winlines
+        assert spec_spinWins == spinWins
+
+    def test_closure_is_cached(self, sample_pay_table):
+        """Test the same configuration returns the same closure."""
+        wild_ids = frozenset([5])
+
+        first = make_check_win(5, sample_pay_table, wild_ids)
+        second = make_check_win(5, sample_pay_table, wild_ids)
+
+        assert first is second
+
+    def test_three_reel_specialization(self, sample_pay_table):
+        """Test a reel count other than five."""
+        check = make_check_win(3, sample_pay_table, frozenset([5]))
+
+        win, code, winlines, spinWins = check([2, 2, 2], 1)
+
+        assert win == 30
+        assert code == "B-3-0-2"
+
+    def test_invalid_reel_count(self, sample_pay_table):
+        """Test reel_count below one is rejected."""
+        with pytest.raises(ValueError):
+            make_check_win(0, sample_pay_table, frozenset([5]))
+
+
+class TestCheckWinsBatch:
+    """Test cases for check_wins_batch function."""
+
+    @pytest.fixture
+    def sample_pay_table(self):
+        """Sample pay table for testing."""
+        return {
+            2: {1: 10, 2: 15, 3: 20, 5: 25},
+            3: {1: 20, 2: 30, 3: 40, 5: 50},
+            4: {1: 40, 2: 60, 3: 80, 5: 100},
+            5: {1: 100, 2: 150, 3: 200, 5: 250}
+        }
+
+    def test_matches_per_line_check_win(self, sample_pay_table):
+        """Test batch results match per-line check_win calls."""
+        wild_ids = [5]
+        lines = [
+            [2, 2, 2, 1, 3],   # Regular win
+            [5, 2, 2, 1, 3],   # Win with leading wild
+            [5, 5, 5, 5, 5],   # All wilds
+            [5, 5, 3, 2, 1],   # Alternative wild pattern
+            [5, 1, 5, 1, 2],   # Mixed wilds and symbols
+            [9, 9, 9, 9, 9],   # Symbol missing from pay table
+        ]
+
+        wins, codes = check_wins_batch(np.array(lines), wild_ids, sample_pay_table)
+
+        for idx, line in enumerate(lines):
+            wilds = check_wild_symbols(line, wild_ids)
+            expected_win, expected_code, _, _ = check_win(
+                line, idx + 1, wilds, wild_ids, sample_pay_table
+            )
+            assert wins[idx] == expected_win
+            if expected_win > 0:
+                assert codes[idx] == expected_code
+            else:
+                assert codes[idx] is None
+
+    def test_return_arrays_matches_codes(self, sample_pay_table):
+        """Test the SoA result carries the same fields as the code strings."""
+        wild_ids = [5]
+        lines = np.array([
+            [2, 2, 2, 1, 3],
+            [5, 2, 2, 1, 3],
+            [9, 9, 9, 9, 9],
+        ])
+
+        wins, codes = check_wins_batch(lines, wild_ids, sample_pay_table)
+        soa_wins, lengths, wild_flags, symbols = check_wins_batch(
+            lines, wild_ids, sample_pay_table, return_arrays=True
+        )
+
+        assert soa_wins.tolist() == wins.tolist()
+        for i, code in enumerate(codes):
+            if code is not None:
+                assert code == f"B-{lengths[i]}-{wild_flags[i]}-{symbols[i]}"
+
+    def test_no_winning_lines(self, sample_pay_table):
+        """Test batch with no winning lines."""
+        lines = np.array([
+            [1, 2, 3, 4, 6],
+            [6, 7, 8, 9, 1]
+        ])
+
+        wins, codes = check_wins_batch(lines, [5], {1: {}})
+
+        assert wins.tolist() == [0.0, 0.0]
+        assert codes == [None, None]
+
+    def test_multi_line_totals(self, sample_pay_table):
+        """Test batch totals match the multi-line loop."""
+        wild_ids = [5]
+        lines = np.array([
+            [2, 2, 2, 1, 3],
+            [1, 1, 1, 1, 2],
+            [3, 4, 1, 2, 1]
+        ])
+
+        wins, codes = check_wins_batch(lines, wild_ids, sample_pay_table)
+
+        assert wins.sum() == 30 + 40  # Line 1 + Line 2
+        assert codes[0] == "B-3-0-2"
+        assert codes[1] == "B-4-0-1"
+        assert codes[2] is None
+
+    def test_empty_wild_ids(self, sample_pay_table):
+        """Test batch evaluation with no wild symbols defined."""
+        lines = np.array([[3, 3, 3, 1, 2]])
+
+        wins, codes = check_wins_batch(lines, [], sample_pay_table)
+
+        assert wins.tolist() == [40.0]
+        assert codes == ["B-3-0-3"]
+
+
 class TestIntegration:
     """Integration tests combining multiple functions."""
     
@@ -492,8 +1072,8 @@ class TestIntegration:
         """Test how errors propagate through the system."""
         # Invalid code
         winlines, spin_wins = extract_winline_spinwin_data(1, "INVALID", 100.0)
-        assert winlines == []
-        assert spin_wins == [100.0]
+        assert winlines == ()
+        assert spin_wins == (100.0,)
         
         # Use empty winlines in game detail
         game_detail = extract_game_detail(
@@ -501,7 +1081,7 @@ class TestIntegration:
         )
         
         assert game_detail["win"] == 100.0
-        assert game_detail["spinWins"] == [100.0]
+        assert game_detail["spinWins"] == (100.0,)
         assert game_detail["reels"] == [1, 2, 3, 4]
 
 
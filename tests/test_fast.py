@@ -0,0 +1,102 @@
+"""
+Unit tests for slot_game_utils.fast module.
+"""
+
+import pytest
+import numpy as np
+
+pytest.importorskip("numba")
+
+from slot_game_utils import build_wild_lut, check_wild_symbols, check_win
+from slot_game_utils.fast import evaluate_spin
+
+
+class TestEvaluateSpin:
+    """Test cases for evaluate_spin function."""
+
+    @pytest.fixture
+    def sample_pay_table(self):
+        """Sample pay table for testing."""
+        return {
+            3: {0: 50, 1: 30, 2: 25, 3: 20, 4: 15},
+            4: {0: 100, 1: 60, 2: 50, 3: 40, 4: 30},
+            5: {0: 200, 1: 120, 2: 100, 3: 80, 4: 60}
+        }
+
+    @pytest.fixture
+    def game_setup(self):
+        """5x3 spin matrix with three horizontal paylines."""
+        matrix = np.array([
+            [0, 1, 2],
+            [1, 0, 3],
+            [1, 2, 0],
+            [3, 1, 2],
+            [2, 3, 1]
+        ], dtype=np.int32)
+        paylines = np.array([
+            [0, 0, 0, 0, 0],
+            [1, 1, 1, 1, 1],
+            [2, 2, 2, 2, 2]
+        ], dtype=np.int32)
+        return matrix, paylines
+
+    def test_matches_per_line_check_win(self, sample_pay_table, game_setup):
+        """Test kernel results match per-line check_win calls."""
+        matrix, paylines = game_setup
+        wild_ids = [0]
+        wild_lut = build_wild_lut(wild_ids, 4)
+
+        wins, lengths, wild_flags, symbols = evaluate_spin(
+            matrix, paylines, wild_lut, sample_pay_table
+        )
+
+        for idx, coords in enumerate(paylines):
+            line = [int(matrix[r, coords[r]]) for r in range(len(coords))]
+            wilds = check_wild_symbols(line, wild_ids)
+            expected_win, expected_code, _, _ = check_win(
+                line, idx + 1, wilds, wild_ids, sample_pay_table
+            )
+            assert wins[idx] == expected_win
+            if expected_win > 0:
+                assert expected_code == f"B-{lengths[idx]}-{wild_flags[idx]}-{symbols[idx]}"
+
+    def test_all_wild_line(self, sample_pay_table):
+        """Test a fully wild payline pays over the full line."""
+        matrix = np.zeros((5, 1), dtype=np.int32)
+        paylines = np.zeros((1, 5), dtype=np.int32)
+        wild_lut = build_wild_lut([0], 4)
+
+        wins, lengths, wild_flags, symbols = evaluate_spin(
+            matrix, paylines, wild_lut, sample_pay_table
+        )
+
+        assert wins.tolist() == [200.0]
+        assert lengths.tolist() == [5]
+        assert wild_flags.tolist() == [1]
+        assert symbols.tolist() == [0]
+
+    def test_wild_run_beyond_table(self):
+        """Test a leading wild run longer than the pay table's max length."""
+        matrix = np.array([[0], [0], [0], [0], [2]], dtype=np.int32)
+        paylines = np.zeros((1, 5), dtype=np.int32)
+        wild_lut = build_wild_lut([0], 4)
+        pay_table = {2: {1: 10}, 3: {1: 30}}
+
+        wins, lengths, wild_flags, symbols = evaluate_spin(
+            matrix, paylines, wild_lut, pay_table
+        )
+
+        assert wins.tolist() == [0.0]
+        assert lengths.tolist() == [5]
+
+    def test_no_win(self, sample_pay_table):
+        """Test a spin with no winning paylines."""
+        matrix = np.array([[1], [2], [3], [4], [1]], dtype=np.int32)
+        paylines = np.zeros((1, 5), dtype=np.int32)
+        wild_lut = build_wild_lut([], 4)
+
+        wins, lengths, wild_flags, symbols = evaluate_spin(
+            matrix, paylines, wild_lut, sample_pay_table
+        )
+
+        assert wins.tolist() == [0.0]